@@ -1,8 +1,8 @@
 # Author: Austin Cooper
 # GitHub username: amcooper181
 
-from othello_class import *
-from minimax import *
+from othello_class import Othello, Player, InvalidMoveException
+from minimax import minimax
 import random
 
 
@@ -4,7 +4,7 @@
 
 
 import copy
-from othello_class import DIRECTIONS
+from othello_class import DIRECTIONS, get_rays, ray_move
 
 
 def create_next_index(current_index, direct):
@@ -71,12 +71,12 @@ def return_available_positions(board, color):
     elif color == 'white':
         piece = "O"
         opp_piece = "X"
-    for x in range(len(board)):
-        for y in range(len(board[x])):
+    rays = get_rays()
+    for x in range(1, 9):
+        for y in range(1, 9):
             if board[x][y] == piece:
-                current_index = (x,y)
-                valid_moves = check_valid_moves(board, piece, opp_piece, current_index)
-                for item in valid_moves:
+                for ray in rays[x, y]:
+                    item = ray_move(board, opp_piece, ray)
                     if item is not None:
                         if item not in available_positions:
                             available_positions.append(item)
@@ -84,39 +84,6 @@ def return_available_positions(board, color):
     return available_positions
 
 
-def check_valid_moves(board, piece, opp_piece, current_index):
-    """
-    Adapted from Othello class methods for the minimax function, does not make any changes to the game object.
-    """
-    up = check_direction(board, piece, opp_piece, current_index, 'u')
-    down = check_direction(board, piece, opp_piece, current_index, 'd')
-    left = check_direction(board, piece, opp_piece, current_index, 'l')
-    right = check_direction(board, piece, opp_piece, current_index, 'r')
-    up_left = check_direction(board, piece, opp_piece, current_index, 'ul')
-    up_right = check_direction(board, piece, opp_piece, current_index, 'ur')
-    down_left = check_direction(board, piece, opp_piece, current_index, 'dl')
-    down_right = check_direction(board, piece, opp_piece, current_index, 'dr')
-    valid_moves = [up, down, left, right, up_left, up_right, down_left, down_right]
-    return valid_moves
-
-
-def check_direction(board, piece, opp_piece, current_index, direct, first_move=0):
-    """
-    Adapted from Othello class methods for the minimax function, does not make any changes to the game object.
-    """
-    new_index = create_next_index(current_index, direct)
-    row, column = new_index
-    if board[row][column] == "*":
-        return
-    elif board[row][column] == "." and first_move == 0:
-        return
-    elif board[row][column] == "." and first_move > 0:
-        return row, column
-    elif board[row][column] == opp_piece:
-        first_move += 1
-        return check_direction(board, piece, opp_piece, new_index, direct, first_move)
-
-
 def game_over(board):
     """
     Adapted from Othello class methods for the minimax function, does not make any changes to the game object.
@@ -14,6 +14,56 @@ DIRECTIONS = {
     'dr': (1, 1)
 }
 
+_rays = None
+
+
+def _build_rays():
+    """
+    Build the ray table for every playable square (rows and columns 1 through 8). Each ray is the tuple of
+    playable squares visited when traveling in one direction from that square, stopping before the '*' border.
+    """
+    rays = {}
+    for row in range(1, 9):
+        for col in range(1, 9):
+            square_rays = []
+            for delta_row, delta_col in DIRECTIONS.values():
+                ray = []
+                new_row, new_col = row + delta_row, col + delta_col
+                while 1 <= new_row <= 8 and 1 <= new_col <= 8:
+                    ray.append((new_row, new_col))
+                    new_row, new_col = new_row + delta_row, new_col + delta_col
+                if ray:
+                    square_rays.append(tuple(ray))
+            rays[row, col] = tuple(square_rays)
+    return rays
+
+
+def get_rays():
+    """
+    Return the ray table, building it on first use rather than at import time so that processes which only
+    import this module (or never ask the computer for a move) do not pay for it.
+    """
+    global _rays
+    if _rays is None:
+        _rays = _build_rays()
+    return _rays
+
+
+def ray_move(board, opp_piece, ray):
+    """
+    Walk a ray from one of the player's pieces and return the empty square that ends a run of at least one
+    opponent's piece, or None if the ray does not produce a valid move. Shared by the Othello class and the
+    minimax module so that both generate moves the same way.
+    """
+    first_move = 0
+    for row, column in ray:
+        if board[row][column] == opp_piece:
+            first_move += 1
+        elif board[row][column] == "." and first_move > 0:
+            return row, column
+        else:
+            return
+
 
 class InvalidMoveException(Exception):
     pass
@@ -105,48 +155,14 @@ class Othello:
         """Create a player object with a given name and piece color"""
         self._player_list.append(player_object)
 
-    def check_valid_moves(self, piece, opp_piece, current_index):
-        """Check to see if there is a valid move in any direction given a piece, opponents piece, and current index.
-            Return the list of valid moves. Helper method for the check_direction method."""
-        up = self.check_direction(piece, opp_piece, current_index, 'u')
-        down = self.check_direction(piece, opp_piece, current_index, 'd')
-        left = self.check_direction(piece, opp_piece, current_index, 'l')
-        right = self.check_direction(piece, opp_piece, current_index, 'r')
-        up_left = self.check_direction(piece, opp_piece, current_index, 'ul')
-        up_right = self.check_direction(piece, opp_piece, current_index, 'ur')
-        down_left = self.check_direction(piece, opp_piece, current_index, 'dl')
-        down_right = self.check_direction(piece, opp_piece, current_index, 'dr')
-        valid_moves = [up, down, left, right, up_left, up_right, down_left, down_right]
-        return valid_moves
-
     def create_next_index(self, current_index, direct):
         """Returns the next index when traveling in a given direction, given a current index. Used in the
-           check_direction and capture_tiles methods."""
+           capture_tiles method."""
         row, col = current_index
         delta_row, delta_col = DIRECTIONS[direct]
         new_row, new_col = row + delta_row, col + delta_col
         return new_row, new_col
 
-    def check_direction(self, piece, opp_piece, current_index, direct, first_move=0):
-        """
-        Given a piece, opponent piece, the current index, and a direction to check in, checks for a valid move.
-        Returns the row and column of index if the direction results in a move that is valid. Uses the
-        create_next_index method to find the next index in the given direction. First_move has a default value of 0,
-        and is incremented when an opponent piece is found, to only return a move for an empty space if there was
-        already an opponent's piece found in that direction.
-        """
-        new_index = self.create_next_index(current_index, direct)
-        row, column = new_index
-        if self._board[row][column] == "*":
-            return
-        elif self._board[row][column] == "." and first_move == 0:
-            return
-        elif self._board[row][column] == "." and first_move > 0:
-            return row, column
-        elif self._board[row][column] == opp_piece:
-            first_move += 1
-            return self.check_direction(piece, opp_piece, new_index, direct, first_move)
-
     def return_available_positions(self, color):
         """Return a list of positions that the player with the given color can play on the current board"""
         self._available_positions = []
@@ -156,12 +172,12 @@ class Othello:
         elif color == 'white':
             piece = "O"
             opp_piece = "X"
-        for x in range(len(self._board)):
-            for y in range(len(self._board[x])):
+        rays = get_rays()
+        for x in range(1, 9):
+            for y in range(1, 9):
                 if self._board[x][y] == piece:
-                    current_index = (x,y)
-                    valid_moves = self.check_valid_moves(piece, opp_piece, current_index)
-                    for item in valid_moves:
+                    for ray in rays[x, y]:
+                        item = ray_move(self._board, opp_piece, ray)
                         if item is not None:
                             if item not in self._available_positions:
                                 self._available_positions.append(item)
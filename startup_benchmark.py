@@ -0,0 +1,60 @@
+# Measures cold-start cost: how long a fresh process takes to import the game and to produce its first computer move.
+
+import os
+import subprocess
+import sys
+import time
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+IMPORT_SNIPPET = """
+import time
+start = time.perf_counter()
+import game
+print(time.perf_counter() - start)
+"""
+
+FIRST_MOVE_SNIPPET = """
+import time
+from othello_class import Othello
+from minimax import minimax
+board = Othello().get_board()
+start = time.perf_counter()
+minimax(board, {depth}, True)
+print(time.perf_counter() - start)
+"""
+
+
+def time_in_fresh_process(snippet):
+    """
+    Run the snippet in a new Python interpreter started in this directory, so that nothing is already imported or
+    built, and return the number of seconds it reports. Raise RuntimeError with the child's stderr if it fails.
+    """
+    result = subprocess.run([sys.executable, "-c", snippet], capture_output=True, text=True, cwd=PACKAGE_DIR)
+    if result.returncode != 0:
+        raise RuntimeError(f"Benchmark child process failed:\n{result.stderr}")
+    return float(result.stdout.strip())
+
+
+def measure(runs=5, depth=5):
+    """
+    Return the best of several runs for the import latency and the first-move latency, both in seconds, plus the
+    total wall time of starting an interpreter and importing the game.
+    """
+    import_times = []
+    first_move_times = []
+    process_times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        import_times.append(time_in_fresh_process(IMPORT_SNIPPET))
+        process_times.append(time.perf_counter() - start)
+        first_move_times.append(time_in_fresh_process(FIRST_MOVE_SNIPPET.format(depth=depth)))
+    return min(import_times), min(first_move_times), min(process_times)
+
+
+if __name__ == "__main__":
+    depth = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    import_time, first_move_time, process_time = measure(depth=depth)
+    print(f"Import game:              {import_time * 1000:.2f} ms")
+    print(f"Process start + import:   {process_time * 1000:.2f} ms")
+    print(f"First move (depth {depth}):     {first_move_time * 1000:.2f} ms")